@@ -6,8 +6,141 @@ import pickle
 import plotly.express as px
 import plotly.graph_objects as go
 import time
+import os
+import threading
+import json
+import sys
+import logging
+import uuid
+from collections import OrderedDict, deque
 
 ECONOMY_DATA_FILE = 'streamlit/global_economy.csv'  
+MODEL_FILE = 'streamlit/gdp_prediction_model.pkl'
+COUNTRY_ISO_FILE = 'streamlit/country_iso_codes.csv'
+
+# Prediction cache settings (inputs are rounded to the 0.1 slider step)
+PREDICTION_CACHE_SIZE = 4096
+PREDICTION_CACHE_TTL = 3600  # seconds
+PREDICTION_INPUT_PRECISION = 1
+
+# Chart payload limits
+CHART_MAX_POINTS = 2000  # total points sent to Plotly per chart; beyond this, years become decades
+CHART_MAX_SERIES = 50  # country lines before the rest are rolled up
+# Ratios combined across countries as sum(numerator) / sum(denominator)
+RATIO_METRICS = {'Per_capita_GNI': ('Gross_National_IncomeGNI_in_USD', 'Population')}
+# Values in national currencies cannot be combined across countries
+COUNTRY_ONLY_METRICS = {'AMA_exchange_rate', 'IMF_based_exchange_rate'}
+
+# Per capita GNI map color bins (USD), fixed so colors are comparable across years
+GNI_MAP_BINS = [0, 1000, 4000, 12000, 30000, np.inf]
+GNI_MAP_LABELS = ['< $1k', '$1k - $4k', '$4k - $12k', '$12k - $30k', '> $30k']
+GNI_MAP_COLORS = ['#d73027', '#fc8d59', '#fee08b', '#91cf60', '#1a9850']
+# Base-map topojson served from streamlit/static (see .streamlit/config.toml) instead of Plotly's CDN
+PLOTLY_TOPOJSON_URL = os.environ.get('PLOTLY_TOPOJSON_URL', 'app/static/')
+
+# Rerun telemetry, enabled with GLOBAL_ECONOMY_TELEMETRY=1
+TELEMETRY_ENABLED = os.environ.get('GLOBAL_ECONOMY_TELEMETRY', '0') == '1'
+TELEMETRY_LOG_FILE = os.environ.get('GLOBAL_ECONOMY_TELEMETRY_FILE')  # JSON lines; stderr log when unset
+TELEMETRY_HISTORY_SIZE = 200  # recent reruns kept for the sidebar summary
+
+telemetry_logger = logging.getLogger('global_economy.telemetry')
+if TELEMETRY_ENABLED and not telemetry_logger.handlers:
+    telemetry_logger.addHandler(logging.StreamHandler())
+    telemetry_logger.setLevel(logging.INFO)
+    telemetry_logger.propagate = False
+
+rerun_started = time.perf_counter()
+rerun_last_mark = rerun_started
+rerun_sections = {}
+
+# Shared across sessions so hit rates and history cover the whole process
+@st.cache_resource
+def get_telemetry_store():
+    return {
+        'lock': threading.Lock(),
+        'cache_stats': {},
+        'history': deque(maxlen=TELEMETRY_HISTORY_SIZE)
+    }
+
+def telemetry_mark(section):
+    """Record the wall time since the previous mark under the given section name."""
+    global rerun_last_mark
+    if not TELEMETRY_ENABLED:
+        return
+    now = time.perf_counter()
+    rerun_sections[section] = rerun_sections.get(section, 0.0) + (now - rerun_last_mark)
+    rerun_last_mark = now
+
+def telemetry_cache_event(name, event):
+    # 'call' is counted by the caller, 'miss' from inside the cached function body
+    if not TELEMETRY_ENABLED:
+        return
+    store = get_telemetry_store()
+    with store['lock']:
+        stats = store['cache_stats'].setdefault(name, {'call': 0, 'miss': 0})
+        stats[event] += 1
+
+def get_process_rss_mb():
+    """Return (current RSS, peak RSS) in MB; either is None where the platform does not report it."""
+    current = None
+    try:
+        with open('/proc/self/status') as f:
+            for line in f:
+                if line.startswith('VmRSS:'):
+                    current = int(line.split()[1]) / 1024
+                    break
+    except OSError:
+        pass
+    try:
+        import resource  # not available on Windows
+        peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # ru_maxrss is in bytes on macOS and in KB on Linux
+        peak = peak / (1024 * 1024) if sys.platform == 'darwin' else peak / 1024
+    except ImportError:
+        peak = None
+    return current, peak
+
+def emit_rerun_telemetry():
+    """Log this rerun's timings, cache hit rates and RSS as one JSON record."""
+    if not TELEMETRY_ENABLED:
+        return None
+    if 'telemetry_session_id' not in st.session_state:
+        st.session_state['telemetry_session_id'] = uuid.uuid4().hex[:12]
+
+    store = get_telemetry_store()
+    with store['lock']:
+        cache_stats = {
+            name: {
+                'calls': stats['call'],
+                'misses': stats['miss'],
+                'hit_rate': round(1 - stats['miss'] / stats['call'], 3) if stats['call'] else None
+            }
+            for name, stats in store['cache_stats'].items()
+        }
+    rss_mb, rss_peak_mb = get_process_rss_mb()
+    record = {
+        'event': 'rerun',
+        'timestamp': time.time(),
+        'session_id': st.session_state['telemetry_session_id'],
+        'wall_ms': round((time.perf_counter() - rerun_started) * 1000, 2),
+        'sections_ms': {name: round(seconds * 1000, 2) for name, seconds in rerun_sections.items()},
+        'cache': cache_stats,
+        'rss_mb': round(rss_mb, 1) if rss_mb is not None else None,
+        'rss_peak_mb': round(rss_peak_mb, 1) if rss_peak_mb is not None else None
+    }
+    with store['lock']:
+        store['history'].append(record)
+
+    line = json.dumps(record)
+    if TELEMETRY_LOG_FILE:
+        try:
+            with open(TELEMETRY_LOG_FILE, 'a') as f:
+                f.write(line + '\n')
+        except OSError as e:
+            telemetry_logger.warning(f"Could not write telemetry: {e}")
+    else:
+        telemetry_logger.info(line)
+    return record
 
 # Page configuration
 st.set_page_config(
@@ -45,17 +178,137 @@ st.markdown("""
     }
 </style>
 """, unsafe_allow_html=True)
+telemetry_mark('page_setup')
 
 # Load the dataset
 @st.cache_data
 def load_economy_data():
+    telemetry_cache_event('load_economy_data', 'miss')
     try:
         return pd.read_csv(ECONOMY_DATA_FILE)
     except Exception as e:
         st.error(f"Error loading data: {e}")
         return pd.DataFrame()
 
+telemetry_cache_event('load_economy_data', 'call')
 economy_data = load_economy_data()
+telemetry_mark('data_load')
+
+@st.cache_data(max_entries=256)
+def get_chart_data(metric, countries=(), year_range=None, max_points=CHART_MAX_POINTS):
+    """Aggregate a metric for a line chart.
+
+    The world -> top countries -> country level and year -> decade grain are
+    picked so the returned frame stays within max_points rows: a wide year
+    span with many lines is shown by decade, a narrower one by year.
+    Returns (frame with Series/Year/metric columns, level, grain).
+    """
+    if metric in COUNTRY_ONLY_METRICS and not 0 < len(countries) <= CHART_MAX_SERIES:
+        raise ValueError(f"{metric} can only be charted for 1 to {CHART_MAX_SERIES} countries.")
+
+    columns = ['CountryID', 'Country', 'Year', metric] + list(RATIO_METRICS.get(metric, ()))
+    # Former states overlap their successors for a year or more; count each economy once
+    data = drop_superseded_rows(economy_data[columns]).dropna()
+    if year_range is not None:
+        data = data[data['Year'].between(year_range[0], year_range[1])]
+
+    if not countries:
+        level = 'world'
+        data = data.assign(Series='World')
+    else:
+        data = data[data['Country'].isin(countries)]
+        if len(countries) <= CHART_MAX_SERIES:
+            level = 'country'
+            data = data.assign(Series=data['Country'])
+        else:
+            # Keep the largest countries by their latest value, roll the rest up
+            level = 'top_countries'
+            latest = data.sort_values('Year').groupby('Country')[metric].last()
+            top = set(latest.nlargest(CHART_MAX_SERIES - 1).index)
+            data = data.assign(Series=data['Country'].where(data['Country'].isin(top), 'Rest of selection'))
+
+    # Combine countries within each line; country-level lines hold a single country per year
+    grouped = data.groupby(['Series', 'Year'], as_index=False)
+    if level != 'country' and metric in RATIO_METRICS:
+        numerator, denominator = RATIO_METRICS[metric]
+        series = grouped[[numerator, denominator]].sum()
+        series[metric] = series[numerator] / series[denominator]
+        series = series[['Series', 'Year', metric]]
+    else:
+        series = grouped[metric].sum()
+    n_series = max(series['Series'].nunique(), 1)
+    budget = max_points // n_series
+    grain = 'year'
+
+    if len(series) and series.groupby('Series').size().max() > budget:
+        # Average the years in each decade so partial decades at either end stay comparable
+        grain = 'decade'
+        series = series.assign(Year=series['Year'] // 10 * 10)
+        series = series.groupby(['Series', 'Year'], as_index=False)[metric].mean()
+
+    return series, level, grain
+
+# Former states map to every successor's ISO code, so one CountryID can have several rows
+@st.cache_data
+def load_country_iso_codes():
+    try:
+        return pd.read_csv(COUNTRY_ISO_FILE)
+    except Exception as e:
+        st.error(f"Error loading country codes: {e}")
+        return pd.DataFrame(columns=['CountryID', 'ISO3'])
+
+def drop_superseded_rows(data):
+    """Drop former states' rows in years where one of their successors already reports."""
+    iso_codes = load_country_iso_codes()
+    coded = data[['CountryID', 'Country', 'Year']].merge(iso_codes, on='CountryID')
+    former = coded['Country'].str.contains('Former', regex=False)
+    current = coded.loc[~former, ['Year', 'ISO3']].drop_duplicates()
+    superseded = coded[former].merge(current, on=['Year', 'ISO3'])[['CountryID', 'Year']].drop_duplicates()
+
+    keys = pd.MultiIndex.from_frame(data[['CountryID', 'Year']])
+    return data[~keys.isin(pd.MultiIndex.from_frame(superseded))]
+
+@st.cache_data
+def load_gni_map_frames():
+    """Map countries to ISO codes once and split binned Per_capita_GNI by year."""
+    iso_codes = load_country_iso_codes()
+    if iso_codes.empty:
+        return {}
+
+    columns = ['CountryID', 'Country', 'Year', 'Population', 'Gross_National_IncomeGNI_in_USD', 'Per_capita_GNI']
+    data = drop_superseded_rows(economy_data[columns]).merge(iso_codes, on='CountryID')
+    # Entities still sharing a code (the two Yemens before 1989, mainland Tanzania and Zanzibar) are combined
+    data = data.groupby(['Year', 'ISO3'], as_index=False).agg(
+        Country=('Country', ' / '.join),
+        Entities=('CountryID', 'size'),
+        Population=('Population', 'sum'),
+        GNI=('Gross_National_IncomeGNI_in_USD', 'sum'),
+        Per_capita_GNI=('Per_capita_GNI', 'first')
+    )
+    data['Per_capita_GNI'] = data['Per_capita_GNI'].where(data['Entities'] == 1, data['GNI'] / data['Population'])
+    data = data.assign(GNI_Level=pd.cut(data['Per_capita_GNI'], GNI_MAP_BINS, labels=GNI_MAP_LABELS, right=False).astype(str))
+
+    return {
+        int(year): frame[['ISO3', 'Country', 'Per_capita_GNI', 'GNI_Level']].reset_index(drop=True)
+        for year, frame in data.groupby('Year')
+    }
+
+@st.cache_resource
+def get_gni_map_figure(year):
+    frame = load_gni_map_frames()[year]
+    fig = px.choropleth(
+        frame,
+        locations='ISO3',
+        color='GNI_Level',
+        hover_name='Country',
+        hover_data={'ISO3': False, 'GNI_Level': False, 'Per_capita_GNI': ':,.0f'},
+        category_orders={'GNI_Level': GNI_MAP_LABELS},
+        color_discrete_map=dict(zip(GNI_MAP_LABELS, GNI_MAP_COLORS)),
+        labels={'GNI_Level': 'Per Capita GNI', 'Per_capita_GNI': 'Per Capita GNI (USD)'}
+    )
+    fig.update_geos(showframe=False, projection_type='natural earth')
+    fig.update_layout(height=600, margin=dict(l=0, r=0, t=30, b=0), title_text=f"Per Capita GNI, {year}")
+    return fig
 
 dashboard_embed_codes = {
     "Trade Flows by Country": """
@@ -144,45 +397,6 @@ dashboard_embed_codes = {
     </div>
     """,
     
-    "Per Capita GNI Map": """
-    <div style='border-radius: 10px; overflow: hidden; padding: 10px; background-color: #f0f0f0; margin: 0 auto; width: 95%; max-width: 1200px;'>
-        <div style='background-color: #4b3f72; color: #ffd166; padding: 8px; margin-bottom: 10px; border-radius: 8px; text-align: center; font-weight: bold; max-width: 600px; margin-left: auto; margin-right: auto;'>
-            For better viewing please use the full screen button in the bottom right corner.
-        </div>
-        <div class='tableauPlaceholder' id='viz1745349196215' style='position: relative'>
-            <noscript>
-                <a href='#'>
-                    <img alt='Per Capita GNI, Monitoring on the World Map ' src='https://public.tableau.com/static/images/Pe/PerCapitaGNIMonitoringontheWorldMap/PerCapitaGNIMonitoringontheWorldMap/1_rss.png' style='border: none' />
-                </a>
-            </noscript>
-            <object class='tableauViz' style='display:none;'>
-                <param name='host_url' value='https%3A%2F%2Fpublic.tableau.com%2F' />
-                <param name='embed_code_version' value='3' />
-                <param name='site_root' value='' />
-                <param name='name' value='PerCapitaGNIMonitoringontheWorldMap/PerCapitaGNIMonitoringontheWorldMap' />
-                <param name='tabs' value='no' />
-                <param name='toolbar' value='yes' />
-                <param name='static_image' value='https://public.tableau.com/static/images/Pe/PerCapitaGNIMonitoringontheWorldMap/PerCapitaGNIMonitoringontheWorldMap/1.png' />
-                <param name='animate_transition' value='yes' />
-                <param name='display_static_image' value='yes' />
-                <param name='display_spinner' value='yes' />
-                <param name='display_overlay' value='yes' />
-                <param name='display_count' value='yes' />
-                <param name='language' value='en-US' />
-            </object>
-        </div>
-        <script type='text/javascript'>
-           var divElement = document.getElementById('viz1745348885230');
-           var vizElement = divElement.getElementsByTagName('object')[0];
-           vizElement.style.width='100%';
-           vizElement.style.height='800px';  // Sabit yükseklik
-           var scriptElement = document.createElement('script');
-           scriptElement.src = 'https://public.tableau.com/javascripts/api/viz_v1.js';
-           vizElement.parentNode.insertBefore(scriptElement, vizElement);
-        </script>
-    </div>
-    """,
-    
     "Sectors by Decades": """
     <div style='border-radius: 10px; overflow: hidden; padding: 10px; background-color: #f0f0f0; margin: 0 auto; width: 95%; max-width: 1200px;'>
         <div style='background-color: #4b3f72; color: #ffd166; padding: 8px; margin-bottom: 10px; border-radius: 8px; text-align: center; font-weight: bold; max-width: 600px; margin-left: auto; margin-right: auto;'>
@@ -262,14 +476,27 @@ dashboard_embed_codes = {
     """
 }
 # Load ML model for economic forecasting
+def get_model_version(model_info):
+    # Fall back to the pickle's modification time when the model carries no version
+    version = model_info.get('version')
+    if version is None:
+        try:
+            version = os.path.getmtime(MODEL_FILE)
+        except OSError:
+            version = id(model_info['model'])
+    return str(version)
+
 @st.cache_resource
 def load_forecast_model():
+    telemetry_cache_event('load_forecast_model', 'miss')
     try:
-        with open("streamlit/gdp_prediction_model.pkl", 'rb') as f:
+        with open(MODEL_FILE, 'rb') as f:
             model_info = pickle.load(f)
             
         # Model bilgilerinin doğru yapıda olduğunu kontrol et
         if isinstance(model_info, dict) and 'model' in model_info:
+            # Resolved once per load so the prediction cache key matches the model in memory
+            model_info['model_version'] = get_model_version(model_info)
             return model_info
         else:
             st.error("Model dosyası beklenen formatta değil.")
@@ -278,6 +505,48 @@ def load_forecast_model():
         st.error(f"Error loading model: {e}")
         return None
 
+# Shared across sessions so repeated slider scenarios skip model.predict
+@st.cache_resource
+def get_prediction_cache():
+    return {
+        'entries': OrderedDict(),
+        'lock': threading.Lock(),
+        'hits': 0,
+        'misses': 0
+    }
+
+def predict_forecast(model_info, input_data):
+    """Predict with the loaded model, reusing results for previously seen scenarios."""
+    if model_info is None:
+        raise ValueError("Economic forecast model is not loaded.")
+    # Quantize to widget precision so float noise from sliders maps to one key
+    quantized = {
+        name: round(float(value), PREDICTION_INPUT_PRECISION)
+        for name, value in input_data.items()
+    }
+    key = (model_info['model_version'], tuple(quantized.items()))
+    cache = get_prediction_cache()
+    now = time.monotonic()
+
+    with cache['lock']:
+        entry = cache['entries'].get(key)
+        if entry is not None and now - entry[1] < PREDICTION_CACHE_TTL:
+            cache['entries'].move_to_end(key)
+            cache['hits'] += 1
+            return entry[0]
+        cache['misses'] += 1
+
+    prediction = model_info['model'].predict(pd.DataFrame([quantized]))[0]
+
+    with cache['lock']:
+        cache['entries'][key] = (prediction, now)
+        cache['entries'].move_to_end(key)
+        while len(cache['entries']) > PREDICTION_CACHE_SIZE:
+            cache['entries'].popitem(last=False)
+
+    return prediction
+
+telemetry_cache_event('load_forecast_model', 'call')
 model_info = load_forecast_model()
 model_loaded = model_info is not None
 
@@ -285,6 +554,8 @@ if model_loaded:
     model = model_info['model']
     selected_features = model_info['features']
     r2_score_val = model_info.get('r2_score', 0.9887)
+    model_version = model_info['model_version']
+telemetry_mark('model_load')
 
 # Main title and description
 st.markdown('<h1 class="main-header">🌍 Global Economy Analysis & Forecasting</h1>', unsafe_allow_html=True)
@@ -306,17 +577,25 @@ with st.expander("Model Diagnostic Information", expanded=False):
             'Trade_Balance': -2.5,
             'Region_Asia': 0
         }
-        test_df = pd.DataFrame([test_data])
         
         st.write("Test data:", test_data)
         
         try:
-            test_prediction = model_info['model'].predict(test_df)[0]
+            test_prediction = predict_forecast(model_info, test_data)
             st.write("Test forecast prediction:", test_prediction)
         except Exception as predict_error:
             st.error(f"Could not make test prediction: {predict_error}")
+        
+        prediction_cache = get_prediction_cache()
+        st.write("Prediction cache:", {
+            'model_version': model_version,
+            'entries': len(prediction_cache['entries']),
+            'hits': prediction_cache['hits'],
+            'misses': prediction_cache['misses']
+        })
     else:
         st.warning("Economic forecast model not loaded. Some functionality may be limited.")
+telemetry_mark('diagnostics')
 
 # Navigation with tabs
 # tabs = st.tabs(["📊 Economic Dashboards", "📈 Economic Forecasting", "🔍 Country Comparison"])
@@ -370,31 +649,69 @@ with tab1:
     # Dashboard display section
     dashboard_displayed = False
     
-    if dashboard_choice1 or dashboard_choice2 or dashboard_choice3 or dashboard_choice4 or dashboard_choice5:
-        loading_message.success("Dashboard is loading. You can view it by scrolling down.")
+    # The selected dashboard stays open across reruns triggered by other widgets
+    dashboard_buttons = {
+        "Trade Flows by Country": dashboard_choice1,
+        "USD Exchange Rate": dashboard_choice2,
+        "Per Capita GNI Map": dashboard_choice3,
+        "Sectors by Decades": dashboard_choice4,
+        "Sectoral Spending Distribution": dashboard_choice5
+    }
+    for dashboard_name, clicked in dashboard_buttons.items():
+        if clicked:
+            st.session_state['active_dashboard'] = dashboard_name
+    active_dashboard = st.session_state.get('active_dashboard')
+    
+    if active_dashboard:
+        if any(dashboard_buttons.values()):
+            loading_message.success("Dashboard is loading. You can view it by scrolling down.")
         dashboard_displayed = True
         st.markdown('<div id="dashboard-view" class="dashboard-view"></div>', unsafe_allow_html=True)
         st.info("💡 **Please make it full screen for better viewing.**")
+        st.markdown(f"### {active_dashboard} Dashboard")
         
-        if dashboard_choice1:
-            st.markdown("### Trade Flows by Country Dashboard")
-            components.html(dashboard_embed_codes["Trade Flows by Country"], height=800, scrolling=True)
-        elif dashboard_choice2:
-            st.markdown("### USD Exchange Rate Dashboard")
-            components.html(dashboard_embed_codes["USD Exchange Rate"], height=800, scrolling=True)
-        elif dashboard_choice3:
-            st.markdown("### Per Capita GNI Map Dashboard")
-            components.html(dashboard_embed_codes["Per Capita GNI Map"], height=800, scrolling=True)
-        elif dashboard_choice4:
-            st.markdown("### Sectors by Decades Dashboard")
-            components.html(dashboard_embed_codes["Sectors by Decades"], height=800, scrolling=True)
-        elif dashboard_choice5:
-            st.markdown("### Sectoral Spending Distribution Dashboard")
-            components.html(dashboard_embed_codes["Sectoral Spending Distribution"], height=800, scrolling=True)
+        if active_dashboard == "Per Capita GNI Map":
+            gni_map_frames = load_gni_map_frames()
+            if gni_map_frames:
+                gni_years = sorted(gni_map_frames)
+                gni_year = st.select_slider("Year", options=gni_years, value=gni_years[-1], key="gni_map_year")
+                st.plotly_chart(get_gni_map_figure(gni_year), use_container_width=True,
+                                config={'topojsonURL': PLOTLY_TOPOJSON_URL})
+        else:
+            components.html(dashboard_embed_codes[active_dashboard], height=800, scrolling=True)
             
     
     if not dashboard_displayed:
         st.info("👆 Select a dashboard above or explore the other tabs to use our forecasting tools.")
+    telemetry_mark('dashboards')
+    
+    # Indicator trends drawn from the local dataset
+    if not economy_data.empty:
+        st.markdown('<div class="dashboard-main-title">Indicator Trends</div>', unsafe_allow_html=True)
+        
+        trend_col1, trend_col2 = st.columns(2)
+        numeric_metrics = [col for col in economy_data.select_dtypes(include='number').columns
+                           if col not in ('CountryID', 'Year')]
+        
+        with trend_col1:
+            trend_metric = st.selectbox("Indicator", numeric_metrics,
+                                        index=numeric_metrics.index('Gross_Domestic_Product_GDP'))
+            trend_years = st.slider("Years", int(economy_data['Year'].min()), int(economy_data['Year'].max()),
+                                    (int(economy_data['Year'].min()), int(economy_data['Year'].max())))
+        
+        with trend_col2:
+            trend_countries = st.multiselect("Countries (leave empty for world total)",
+                                             sorted(economy_data['Country'].unique()))
+        
+        if trend_metric in COUNTRY_ONLY_METRICS and not 0 < len(trend_countries) <= CHART_MAX_SERIES:
+            st.info(f"Exchange rates are in national currencies. Select 1 to {CHART_MAX_SERIES} countries to compare them.")
+        else:
+            trend_data, trend_level, trend_grain = get_chart_data(trend_metric, tuple(sorted(trend_countries)), trend_years)
+            fig = px.line(trend_data, x='Year', y=trend_metric, color='Series')
+            legend_title = f"{trend_level.replace('_', ' ').title()} ({trend_grain})"
+            fig.update_layout(height=450, legend_title_text=legend_title)
+            st.plotly_chart(fig, use_container_width=True)
+    telemetry_mark('trends')
 
 # # Tab 2: Economic Forecasting
 # with tab2:
@@ -434,18 +751,14 @@ with tab1:
 #             # Add more features as needed
 #         }
         
-#         # Create input dataframe for prediction
-#         input_df = pd.DataFrame([input_data])
-        
 #         # Prediction button
 #         if st.button("Generate Economic Forecast", use_container_width=True):
 #             # Show a spinner while calculating
 #             with st.spinner("Calculating forecast..."):
-#                 time.sleep(1)  # Simulate computation time
                 
 #                 try:
 #                     # Make prediction
-#                     prediction = model.predict(input_df)[0]
+#                     prediction = predict_forecast(model_info, input_data)
                     
 #                     # Display prediction with nice formatting
 #                     st.success("Forecast Generated Successfully!")
@@ -726,3 +1039,21 @@ This application provides global economic analysis and forecasting using data vi
 st.sidebar.title("Creator")
 st.sidebar.markdown("Developer: Ilker Aydin Yilmaz")
 st.sidebar.markdown("[GitHub Repository](https://github.com/IamIlker0/global-economy-analysis)")
+telemetry_mark('sidebar')
+
+rerun_record = emit_rerun_telemetry()
+if rerun_record is not None:
+    with st.sidebar.expander("Rerun Telemetry", expanded=False):
+        st.write("This rerun:", rerun_record)
+        telemetry_store = get_telemetry_store()
+        with telemetry_store['lock']:
+            history = [
+                record for record in telemetry_store['history']
+                if record['session_id'] == rerun_record['session_id']
+            ]
+        section_totals = {}
+        for record in history:
+            for name, ms in record['sections_ms'].items():
+                section_totals[name] = section_totals.get(name, 0.0) + ms
+        st.write(f"Average section time over this session's last {len(history)} reruns (ms):",
+                 {name: round(total / len(history), 2) for name, total in section_totals.items()})